@@ -19,7 +19,7 @@ import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Adw, Gtk
+from gi.repository import Adw, GLib, Gtk
 
 from .services import (
     OBSConnectionConfig,
@@ -71,6 +71,8 @@ from .actions.ConnectionStatus import ConnectionStatus
 class TwitchatIntegrationPlugin(PluginBase):
     """StreamController plugin entry point for Twitchat integration."""
 
+    PERSIST_DEBOUNCE_MS = 250
+
     def __init__(self) -> None:
         super().__init__(use_legacy_locale=False)
 
@@ -79,7 +81,14 @@ class TwitchatIntegrationPlugin(PluginBase):
         self.twitchat = TwitchatAPI(self.obs_manager)
         self.obs_manager.add_raw_handler(self.twitchat.handle_raw_message)
         self.obs_manager.add_disconnect_callback(lambda: self._notify_connection(False))
+        self.obs_manager.add_reconnect_callback(lambda: self._notify_connection(True))
         self._connection_listeners: list = []
+        # Debounced persistence state; _update_settings may run off the GTK
+        # main loop (deck key handlers), so it is only touched under the lock.
+        self._persist_lock = threading.Lock()
+        self._persist_generation = 0
+        self._persist_pending = False
+        self._config_rows: list[tuple[Adw.PreferencesRow, int]] | None = None
 
         self.has_plugin_settings = True
 
@@ -100,7 +109,7 @@ class TwitchatIntegrationPlugin(PluginBase):
     # Public API for actions
     # ------------------------------------------------------------------
     def broadcast(self, action: str, payload: dict | None = None) -> bool:
-        """Send a Twitchat action. Convenience wrapper for actions."""
+        """Queue a Twitchat action. False if OBS is not connected (see TwitchatAPI.send_action)."""
         return self.twitchat.send_action(action, payload)
 
     def add_connection_listener(self, callback) -> None:
@@ -127,6 +136,9 @@ class TwitchatIntegrationPlugin(PluginBase):
     # ------------------------------------------------------------------
     def on_disconnect(self, conn) -> None:
         try:
+            self._flush_pending_persist()
+            self.twitchat.flush()
+            self.twitchat.close()
             self.obs_manager.disconnect()
         finally:
             super().on_disconnect(conn)
@@ -135,26 +147,30 @@ class TwitchatIntegrationPlugin(PluginBase):
     # Settings UI
     # ------------------------------------------------------------------
     def get_config_rows(self) -> list[Adw.PreferencesRow]:
-        rows: list[Adw.PreferencesRow] = []
+        if self._config_rows is None:
+            self._config_rows = self._build_config_rows()
+        else:
+            self._refresh_config_rows()
+        return [row for row, _ in self._config_rows]
+
+    def _build_config_rows(self) -> list[tuple[Adw.PreferencesRow, int]]:
+        rows: list[tuple[Adw.PreferencesRow, int]] = []
 
         host_row = Adw.EntryRow()
         host_row.set_title("OBS Host")
         host_row.set_text(self.settings.host)
-        host_row.connect("changed", self._on_host_changed)
-        rows.append(host_row)
+        rows.append((host_row, host_row.connect("changed", self._on_host_changed)))
 
         port_row = Adw.EntryRow()
         port_row.set_title("Port")
         port_row.set_input_purpose(Gtk.InputPurpose.DIGITS)
         port_row.set_text(str(self.settings.port))
-        port_row.connect("changed", self._on_port_changed)
-        rows.append(port_row)
+        rows.append((port_row, port_row.connect("changed", self._on_port_changed)))
 
         password_row = Adw.PasswordEntryRow()
         password_row.set_title("Password")
         password_row.set_text(self.settings.password)
-        password_row.connect("changed", self._on_password_changed)
-        rows.append(password_row)
+        rows.append((password_row, password_row.connect("changed", self._on_password_changed)))
 
         col_row = Adw.ComboRow(title="Chat Column")
         col_model = Gtk.StringList()
@@ -162,11 +178,32 @@ class TwitchatIntegrationPlugin(PluginBase):
             col_model.append(f"Column {i}")
         col_row.set_model(col_model)
         col_row.set_selected(self.settings.chat_column)
-        col_row.connect("notify::selected", lambda r, _: self._on_chat_column_changed(r.get_selected()))
-        rows.append(col_row)
+        rows.append((
+            col_row,
+            col_row.connect("notify::selected", lambda r, _: self._on_chat_column_changed(r.get_selected())),
+        ))
 
         return rows
 
+    def _refresh_config_rows(self) -> None:
+        """Re-sync cached rows with the current settings without firing their handlers."""
+        for row, handler_id in self._config_rows:
+            # Detach from the previous preferences group so the row can be re-added.
+            group = row.get_ancestor(Adw.PreferencesGroup)
+            if group is not None:
+                group.remove(row)
+            row.handler_block(handler_id)
+
+        host_row, port_row, password_row, col_row = (row for row, _ in self._config_rows)
+        try:
+            host_row.set_text(self.settings.host)
+            port_row.set_text(str(self.settings.port))
+            password_row.set_text(self.settings.password)
+            col_row.set_selected(self.settings.chat_column)
+        finally:
+            for row, handler_id in self._config_rows:
+                row.handler_unblock(handler_id)
+
     def get_settings_area(self) -> Adw.PreferencesGroup:
         from GtkHelper.GtkHelper import BetterPreferencesGroup
 
@@ -203,6 +240,33 @@ class TwitchatIntegrationPlugin(PluginBase):
     def _persist_settings(self) -> None:
         self.set_settings(self.settings.to_dict())
 
+    def _schedule_persist(self) -> None:
+        """Coalesce bursts of edits (one per typed character) into one write.
+
+        Superseded timeouts are left to fire and do nothing, so no source id
+        is ever removed from a thread that might race the main loop.
+        """
+        with self._persist_lock:
+            self._persist_generation += 1
+            self._persist_pending = True
+            generation = self._persist_generation
+        GLib.timeout_add(self.PERSIST_DEBOUNCE_MS, self._on_persist_timeout, generation)
+
+    def _on_persist_timeout(self, generation: int) -> bool:
+        with self._persist_lock:
+            if generation != self._persist_generation or not self._persist_pending:
+                return GLib.SOURCE_REMOVE
+            self._persist_pending = False
+        self._persist_settings()
+        return GLib.SOURCE_REMOVE
+
+    def _flush_pending_persist(self) -> None:
+        with self._persist_lock:
+            pending = self._persist_pending
+            self._persist_pending = False
+        if pending:
+            self._persist_settings()
+
     def _update_settings(self, **changes: Any) -> None:
         new_settings = self.settings.update(**changes)
         if new_settings == self.settings:
@@ -215,7 +279,7 @@ class TwitchatIntegrationPlugin(PluginBase):
             port=self.settings.port,
             password=self.settings.password,
         )
-        self._persist_settings()
+        self._schedule_persist()
 
         if not self.obs_manager.is_connected():
             self._connect_in_background()
@@ -6,6 +6,7 @@ from .obs_connection import (
     OBSNotConnectedError,
     OBSRequestError,
     OBSResponseTimeoutError,
+    encode_json,
 )
 from .twitchat import TwitchatAPI
 
@@ -18,4 +19,5 @@ __all__ = [
     "OBSRequestError",
     "OBSResponseTimeoutError",
     "TwitchatAPI",
+    "encode_json",
 ]
@@ -1,22 +1,54 @@
 from __future__ import annotations
 
 import base64
+import functools
 import hashlib
+import itertools
 import json
+import queue
+import selectors
+import socket
 import threading
-import time
-import uuid
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from typing import Any, Callable, Dict, Optional
 
 from loguru import logger
 from websocket import (
+    ABNF,
     WebSocket,
     WebSocketConnectionClosedException,
     WebSocketException,
     create_connection,
 )
 
+try:  # Optional C accelerated JSON codec for the socket hot path
+    import orjson
+except ImportError:  # pragma: no cover - depends on env
+    orjson = None
+
+if orjson is not None:
+    encode_json = orjson.dumps
+    _loads = orjson.loads
+else:  # pragma: no cover - depends on env
+
+    def encode_json(obj: Any) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
+
+def _encode_data(request_data: Optional[Dict[str, Any] | bytes]) -> bytes:
+    if type(request_data) is bytes:
+        return request_data
+    return encode_json(request_data or {})
+
+
+@functools.lru_cache(maxsize=64)
+def _encoded_prefix(request_type: str) -> bytes:
+    """Constant leading bytes of an op=6 Request frame for ``request_type``."""
+    return b'{"op":6,"d":{"requestType":' + encode_json(request_type) + b',"requestId":"'
+
 
 class OBSConnectionError(Exception):
     """Base class for OBS WebSocket related errors."""
@@ -45,7 +77,7 @@ class OBSRequestError(OBSConnectionError):
         super().__init__(f"{request_type} failed with code {code}: {message}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OBSConnectionConfig:
     """User configurable parameters for the OBS WebSocket connection."""
 
@@ -55,15 +87,40 @@ class OBSConnectionConfig:
     use_ssl: bool = False
     request_timeout: float = 5.0
     event_subscriptions: int = 1  # General events (required for CustomEvent delivery)
+    keepalive_interval: float = 20.0  # Seconds of inactivity before a WebSocket ping
+    _url: str = field(init=False, repr=False, compare=False)
 
-    def as_url(self) -> str:
+    def __post_init__(self) -> None:
         scheme = "wss" if self.use_ssl else "ws"
-        return f"{scheme}://{self.host}:{self.port}"
+        object.__setattr__(self, "_url", f"{scheme}://{self.host}:{self.port}")
+
+    def as_url(self) -> str:
+        return self._url
+
+
+# websocket-client already enables TCP_NODELAY; add a larger receive buffer
+# so event floods need fewer read syscalls.
+_SOCKET_OPTIONS = ((socket.SOL_SOCKET, socket.SO_RCVBUF, 262144),)
+
+# Writer queue control items; everything else on the queue is an encoded frame.
+_PING = object()
+_STOP = object()
+
+
+@dataclass
+class _ResponseSlot:
+    """Holds the reply to a single in-flight request and wakes only its waiter."""
+
+    event: threading.Event = field(default_factory=threading.Event)
+    data: Optional[Dict[str, Any]] = None
 
 
 class OBSConnectionManager:
     """Lightweight OBS WebSocket RPC client tailored for StreamController plugins."""
 
+    RECONNECT_INITIAL_DELAY = 0.5
+    RECONNECT_MAX_DELAY = 30.0
+
     def __init__(self, config: OBSConnectionConfig | None = None) -> None:
         self._config = config or OBSConnectionConfig()
 
@@ -71,14 +128,38 @@ class OBSConnectionManager:
         self._rpc_version: int = 1
 
         self._connection_lock = threading.Lock()
-        self._send_lock = threading.Lock()
-        self._responses: Dict[str, Dict[str, Any]] = {}
-        self._response_condition = threading.Condition()
+        # Producers enqueue encoded frames; only the writer thread touches the socket.
+        self._send_queue: Optional[queue.SimpleQueue] = None
+        # Set when the writer hit a socket error; nothing will drain the queue.
+        self._writer_failed = False
+        self._writer_thread: Optional[threading.Thread] = None
+        self._responses: Dict[str, _ResponseSlot] = {}
+        # requestIds only need to be unique within this process.
+        self._req_counter = itertools.count().__next__
         self._receiver_thread: Optional[threading.Thread] = None
         self._receiver_running = threading.Event()
+        self._wakeup_w: Optional[socket.socket] = None
         self._identified = threading.Event()
         self._raw_handlers: list[Callable[[str], None]] = []
+        # op -> handler for frames read by the receiver thread.
+        self._dispatch: Dict[int, Callable[[Dict[str, Any]], None]] = {
+            0: self._on_hello,
+            2: self._on_identified,
+            5: self._on_event,
+            7: self._on_response,
+            8: self._on_response,
+            9: self._on_response,
+        }
         self._disconnect_callbacks: list[Callable[[], None]] = []
+        self._reconnect_callbacks: list[Callable[[], None]] = []
+
+        # Set while the owner wants a live connection; cleared by disconnect().
+        self._keep_connected = threading.Event()
+        self._reconnect_timer: Optional[threading.Timer] = None
+        self._reconnect_delay = self.RECONNECT_INITIAL_DELAY
+
+        # (password, salt, base64 secret); only the challenge varies per handshake.
+        self._auth_secret_cache: Optional[tuple[str, str, bytes]] = None
 
     def add_raw_handler(self, handler: Callable[[str], None]) -> None:
         """Register a handler that receives every raw WebSocket message string."""
@@ -100,6 +181,16 @@ class OBSConnectionManager:
         except ValueError:
             pass
 
+    def add_reconnect_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback invoked when a dropped connection is re-established."""
+        self._reconnect_callbacks.append(callback)
+
+    def remove_reconnect_callback(self, callback: Callable[[], None]) -> None:
+        try:
+            self._reconnect_callbacks.remove(callback)
+        except ValueError:
+            pass
+
     # ------------------------------------------------------------------
     # Configuration helpers
     # ------------------------------------------------------------------
@@ -114,14 +205,19 @@ class OBSConnectionManager:
         if new_config == self._config:
             return self._config
 
+        # Only the socket endpoint needs a new connection. A password change
+        # keeps the already authenticated session and applies on the next
+        # handshake; subscription changes are applied with a Reidentify.
         reconnect_required = (
             new_config.host != self._config.host
             or new_config.port != self._config.port
             or new_config.use_ssl != self._config.use_ssl
-            or new_config.password != self._config.password
         )
+        reidentify_required = new_config.event_subscriptions != self._config.event_subscriptions
 
         was_connected = self.is_connected()
+        if new_config.password != self._config.password:
+            self._auth_secret_cache = None
         self._config = new_config
 
         if was_connected and reconnect_required:
@@ -131,6 +227,14 @@ class OBSConnectionManager:
                 self.connect()
             except OBSConnectionError as exc:
                 logger.error("Failed to reconnect to OBS: {}", exc)
+            else:
+                # disconnect() reported the drop; report the new connection too.
+                self._notify_reconnect()
+        elif was_connected and reidentify_required:
+            try:
+                self._send_reidentify()
+            except OBSConnectionError as exc:
+                logger.error("Failed to update OBS event subscriptions: {}", exc)
 
         return self._config
 
@@ -144,16 +248,21 @@ class OBSConnectionManager:
         """Establish the WebSocket connection and perform the OBS handshake."""
 
         with self._connection_lock:
-            if self.is_connected():
-                return
+            self._keep_connected.set()
+            self._connect_locked(timeout)
 
-            try:
-                self._do_connect(timeout)
-            except OBSConnectionError:
-                raise
-            except Exception as exc:  # pragma: no cover - defensive
-                self._safe_close()
-                raise OBSConnectionError(str(exc)) from exc
+    def _connect_locked(self, timeout: Optional[float]) -> None:
+        """Connect unless already connected. Caller holds ``_connection_lock``."""
+        if self.is_connected():
+            return
+
+        try:
+            self._do_connect(timeout)
+        except OBSConnectionError:
+            raise
+        except Exception as exc:  # pragma: no cover - defensive
+            self._safe_close()
+            raise OBSConnectionError(str(exc)) from exc
 
     def ensure_connection(self) -> None:
         """Connect if not already connected."""
@@ -164,10 +273,19 @@ class OBSConnectionManager:
     def disconnect(self) -> None:
         """Close the connection and stop the receiver thread."""
 
+        self._keep_connected.clear()
+        self._cancel_reconnect()
+
         with self._connection_lock:
+            was_open = self._ws is not None
             self._stop_receiver()
+            self._stop_writer()
             self._safe_close()
             self._identified.clear()
+            self._fail_pending_responses()
+
+        if was_open:
+            self._notify_disconnect()
 
     # ------------------------------------------------------------------
     # Public API
@@ -175,34 +293,80 @@ class OBSConnectionManager:
     def send_request(
         self,
         request_type: str,
-        request_data: Optional[Dict[str, Any]] = None,
+        request_data: Optional[Dict[str, Any] | bytes] = None,
         *,
         timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Send a RPC request to OBS and wait for the response."""
+        """Send a RPC request to OBS and wait for the response.
+
+        ``request_data`` may also be pre-encoded JSON bytes, which are spliced
+        into the frame without being re-serialized.
+        """
 
         if not self.is_connected():
             raise OBSNotConnectedError("OBS WebSocket is not connected")
 
-        request_id = str(uuid.uuid4())
-        payload = {
-            "op": 6,
-            "d": {
-                "requestType": request_type,
-                "requestId": request_id,
-                "requestData": request_data or {},
-            },
-        }
+        request_id = format(self._req_counter(), "x")
+        message = (
+            _encoded_prefix(request_type)
+            + request_id.encode("ascii")
+            + b'","requestData":'
+            + _encode_data(request_data)
+            + b"}}"
+        )
 
-        with self._send_lock:
-            self._send(payload)
+        slot = self._responses[request_id] = _ResponseSlot()
+        try:
+            self._send_raw(message)
+        except Exception:
+            self._responses.pop(request_id, None)
+            raise
 
-        response = self._wait_for_response(request_id, timeout)
+        response = self._wait_for_response(request_id, slot, timeout)
         status = response.get("requestStatus", {})
         if not status.get("result", False):
             raise OBSRequestError(request_type, status)
         return response.get("responseData", {})
 
+    def send_request_batch(
+        self,
+        requests: list[tuple[str, Optional[Dict[str, Any] | bytes]]],
+        *,
+        halt_on_failure: bool = False,
+        timeout: Optional[float] = None,
+    ) -> list[Dict[str, Any]]:
+        """Send several RPC requests in a single OBS RequestBatch and wait for the results."""
+
+        if not self.is_connected():
+            raise OBSNotConnectedError("OBS WebSocket is not connected")
+
+        request_id = format(self._req_counter(), "x")
+        message = b"".join(
+            (
+                b'{"op":8,"d":{"requestId":"',
+                request_id.encode("ascii"),
+                b'","haltOnFailure":',
+                b"true" if halt_on_failure else b"false",
+                b',"requests":[',
+                b",".join(
+                    b'{"requestType":' + encode_json(request_type)
+                    + b',"requestData":' + _encode_data(request_data) + b"}"
+                    for request_type, request_data in requests
+                ),
+                b"]}}",
+            )
+        )
+
+        slot = self._responses[request_id] = _ResponseSlot()
+        try:
+            self._send_raw(message)
+        except Exception:
+            self._responses.pop(request_id, None)
+            raise
+
+        response = self._wait_for_response(request_id, slot, timeout)
+        return response.get("results", [])
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -210,21 +374,48 @@ class OBSConnectionManager:
         connect_timeout = timeout or self._config.request_timeout
         logger.debug("Connecting to OBS WebSocket at {}", self._config.as_url())
         try:
-            ws = create_connection(self._config.as_url(), timeout=connect_timeout)
+            ws = create_connection(
+                self._config.as_url(),
+                timeout=connect_timeout,
+                enable_multithread=True,
+                # OBS only sends JSON text; skip the per-byte UTF-8 scan of every frame.
+                skip_utf8_validation=True,
+                suppress_origin=True,
+                sockopt=_SOCKET_OPTIONS,
+            )
         except Exception as exc:  # pragma: no cover - depends on env
             raise OBSConnectionError(f"Failed to connect to OBS at {self._config.as_url()}: {exc}") from exc
 
         self._ws = ws
+        self._writer_failed = False
         try:
             self._perform_handshake(connect_timeout)
         except Exception:
             self._safe_close()
             raise
 
+        self._start_writer()
         self._start_receiver()
 
-    def _perform_handshake(self, timeout: float) -> None:
-        hello = self._recv(timeout)
+    def _perform_handshake(self, timeout: float, hello: Optional[Dict[str, Any]] = None) -> None:
+        if self._ws is None:
+            raise OBSNotConnectedError("Cannot perform handshake, websocket is closed")
+
+        # One timeout covers the whole Hello/Identify/Identified exchange.
+        self._ws.settimeout(timeout)
+        try:
+            self._exchange_identify(hello)
+        finally:
+            if self._ws is not None:
+                # Switch to blocking mode for the dedicated receiver thread.
+                self._ws.settimeout(None)
+
+        self._identified.set()
+        logger.debug("OBS WebSocket handshake completed (RPC version {})", self._rpc_version)
+
+    def _exchange_identify(self, hello: Optional[Dict[str, Any]] = None) -> None:
+        if hello is None:
+            hello = self._recv()
         if hello.get("op") != 0:
             raise OBSConnectionError("Did not receive OBS Hello message during handshake")
 
@@ -247,78 +438,243 @@ class OBSConnectionManager:
 
         self._send(identify_payload)
 
-        identified = self._recv(timeout)
+        identified = self._recv()
         if identified.get("op") != 2:
             raise OBSConnectionError("OBS handshake failed: missing Identified acknowledgement")
 
-        self._identified.set()
-        if self._ws is not None:
-            # Switch to blocking mode for the dedicated receiver thread.
-            self._ws.settimeout(None)
-        logger.debug("OBS WebSocket handshake completed (RPC version {})", self._rpc_version)
-
     def _start_receiver(self) -> None:
         if self._receiver_thread and self._receiver_thread.is_alive():
             return
 
+        if self._wakeup_w is not None:
+            self._wakeup_w.close()
+        wakeup_r, self._wakeup_w = socket.socketpair()
         self._receiver_running.set()
         self._receiver_thread = threading.Thread(
             target=self._receiver_loop,
+            args=(wakeup_r,),
             name="obs-ws-receiver",
             daemon=True,
         )
         self._receiver_thread.start()
 
     def _stop_receiver(self) -> None:
+        """Stop the receiver thread without touching the WebSocket itself."""
         self._receiver_running.clear()
+        if self._wakeup_w is not None:
+            # Closing the write end makes the read end readable (EOF).
+            self._wakeup_w.close()
+            self._wakeup_w = None
         if self._receiver_thread and self._receiver_thread.is_alive():
-            if self._ws is not None:
-                try:
-                    self._ws.close()
-                except WebSocketException:
-                    pass
-            self._receiver_thread.join(timeout=1.0)
+            if self._receiver_thread is not threading.current_thread():
+                self._receiver_thread.join(timeout=1.0)
         self._receiver_thread = None
 
-    def _receiver_loop(self) -> None:
-        while self._receiver_running.is_set():
-            if self._ws is None:
-                break
-            try:
-                message = self._ws.recv()
-            except WebSocketConnectionClosedException:
-                logger.warning("Lost connection to OBS WebSocket")
-                break
-            except OSError:
-                logger.warning("OBS WebSocket recv interrupted")
-                break
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.error("Unexpected OBS WebSocket error: {}", exc)
-                break
+    def _receiver_loop(self, wakeup: socket.socket) -> None:
+        ws = self._ws
+        if ws is None or ws.sock is None:
+            wakeup.close()
+            self._receiver_running.clear()
+            return
+
+        selector = selectors.DefaultSelector()
+        selector.register(ws.sock, selectors.EVENT_READ)
+        selector.register(wakeup, selectors.EVENT_READ)
+        # TLS sockets can hold decrypted bytes that select() cannot see.
+        pending = getattr(ws.sock, "pending", None)
 
-            if message is None:
-                continue
+        keepalive = self._config.keepalive_interval or None
+        # A ping was sent and nothing has been received since.
+        awaiting_pong = False
+
+        try:
+            while self._receiver_running.is_set():
+                if not (pending and pending()):
+                    ready = selector.select(keepalive)
+                    if not ready:
+                        if awaiting_pong:
+                            logger.warning("OBS WebSocket did not answer keepalive ping")
+                            break
+                        if not self._send_keepalive():
+                            break
+                        awaiting_pong = True
+                        continue
+                    if any(key.fileobj is wakeup for key, _ in ready):
+                        break
+                try:
+                    # control_frame=True returns after pongs so the loop can
+                    # get back to select() instead of blocking in recv.
+                    opcode, data = ws.recv_data(control_frame=True)
+                except WebSocketConnectionClosedException:
+                    logger.warning("Lost connection to OBS WebSocket")
+                    break
+                except OSError:
+                    logger.warning("OBS WebSocket recv interrupted")
+                    break
+                except Exception as exc:  # pragma: no cover - defensive
+                    logger.error("Unexpected OBS WebSocket error: {}", exc)
+                    break
+
+                awaiting_pong = False
+                if opcode == ABNF.OPCODE_CLOSE:
+                    logger.warning("OBS WebSocket closed the connection")
+                    break
+                if opcode not in (ABNF.OPCODE_TEXT, ABNF.OPCODE_BINARY):
+                    continue
+                try:
+                    # UTF-8 is checked here rather than per frame by websocket-client.
+                    message = data.decode("utf-8")
+                except UnicodeDecodeError:
+                    logger.warning("Received non UTF-8 OBS payload ({} bytes)", len(data))
+                    continue
+
+                # Dispatch raw message to registered handlers (e.g. TwitchatAPI)
+                for handler in self._raw_handlers:
+                    try:
+                        handler(message)
+                    except Exception:
+                        pass
 
-            # Dispatch raw message to registered handlers (e.g. TwitchatAPI)
-            for handler in self._raw_handlers:
                 try:
-                    handler(message)
-                except Exception:
-                    pass
+                    payload = _loads(message)
+                except json.JSONDecodeError:
+                    logger.warning("Received malformed OBS payload: {}", message)
+                    continue
+
+                self._handle_message(payload)
+        finally:
+            selector.close()
+            wakeup.close()
+
+        if not self._receiver_running.is_set():
+            # Stopped on request (disconnect() may hold the lock and join us).
+            return
+
+        with self._connection_lock:
+            if not self._receiver_running.is_set() or self._ws is not ws:
+                # Stopped on request, or a newer connection already replaced
+                # this one; the owner decides what happens to the socket.
+                return
+
+            self._identified.clear()
+            self._receiver_running.clear()
+            # Forget this thread now so a connect() racing with the callbacks
+            # below starts a fresh receiver.
+            self._receiver_thread = None
+            if self._wakeup_w is not None:
+                self._wakeup_w.close()
+                self._wakeup_w = None
+            self._stop_writer()
+            self._safe_close()
+            self._fail_pending_responses()
+
+        self._notify_disconnect()
+        self._schedule_reconnect()
+
+    def _send_keepalive(self) -> bool:
+        send_queue = self._send_queue
+        if send_queue is None:
+            return False
+        send_queue.put(_PING)
+        return True
+
+    def _start_writer(self) -> None:
+        if self._ws is None:
+            return
+        self._send_queue = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            args=(self._ws, self._send_queue),
+            name="obs-ws-writer",
+            daemon=True,
+        )
+        self._writer_thread.start()
+
+    def _stop_writer(self) -> None:
+        send_queue, self._send_queue = self._send_queue, None
+        if send_queue is not None:
+            send_queue.put(_STOP)
+        writer, self._writer_thread = self._writer_thread, None
+        if writer is not None and writer.is_alive() and writer is not threading.current_thread():
+            writer.join(timeout=1.0)
+
+    def _writer_loop(self, ws: WebSocket, send_queue: queue.SimpleQueue) -> None:
+        while True:
+            item = send_queue.get()
+            if item is _STOP:
+                return
+            try:
+                if item is _PING:
+                    ws.ping()
+                else:
+                    ws.send(item, ABNF.OPCODE_TEXT)
+            except (WebSocketException, OSError) as exc:
+                logger.warning("Failed to send message to OBS: {}", exc)
+                if self._send_queue is send_queue:
+                    self._writer_failed = True
+                    self._send_queue = None
+                # Shut the socket down (keeping the fd valid) so the receiver's
+                # select() wakes with EOF and the reconnect logic takes over.
+                sock = ws.sock
+                if sock is not None:
+                    try:
+                        sock.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+                return
+
+    def _schedule_reconnect(self) -> None:
+        if not self._keep_connected.is_set():
+            return
 
+        delay = self._reconnect_delay
+        self._reconnect_delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+        logger.info("Reconnecting to OBS WebSocket in {:.1f}s", delay)
+        timer = threading.Timer(delay, self._reconnect_worker)
+        timer.name = "obs-ws-reconnect"
+        timer.daemon = True
+        self._reconnect_timer = timer
+        timer.start()
+
+    def _cancel_reconnect(self) -> None:
+        timer = self._reconnect_timer
+        self._reconnect_timer = None
+        if timer is not None:
+            timer.cancel()
+        self._reconnect_delay = self.RECONNECT_INITIAL_DELAY
+
+    def _reconnect_worker(self) -> None:
+        self._reconnect_timer = None
+
+        # Check the flag under the lock and without re-arming it, so a
+        # disconnect() that already ran is never undone by a pending retry.
+        with self._connection_lock:
+            if not self._keep_connected.is_set():
+                return
             try:
-                payload = json.loads(message)
-            except json.JSONDecodeError:
-                logger.warning("Received malformed OBS payload: {}", message)
-                continue
+                self._connect_locked(None)
+            except OBSConnectionError as exc:
+                logger.warning("OBS reconnection attempt failed: {}", exc)
+                failed = True
+            else:
+                failed = False
 
-            self._handle_message(payload)
+        if failed:
+            self._schedule_reconnect()
+            return
 
-        self._identified.clear()
-        self._receiver_running.clear()
-        self._safe_close()
+        self._reconnect_delay = self.RECONNECT_INITIAL_DELAY
+        logger.info("Reconnected to OBS WebSocket")
+        self._notify_reconnect()
+
+    def _notify_reconnect(self) -> None:
+        for cb in self._reconnect_callbacks:
+            try:
+                cb()
+            except Exception:
+                pass
 
-        # Notify disconnect listeners
+    def _notify_disconnect(self) -> None:
         for cb in self._disconnect_callbacks:
             try:
                 cb()
@@ -327,78 +683,106 @@ class OBSConnectionManager:
 
     def _handle_message(self, payload: Dict[str, Any]) -> None:
         op = payload.get("op")
-        data = payload.get("d", {})
+        handler = self._dispatch.get(op)
+        if handler is None:
+            logger.debug("Unhandled OBS message op={}: {}", op, payload.get("d"))
+            return
+        handler(payload.get("d", {}))
 
-        if op == 0:
-            # OBS requested re-identification (hot reload). Repeat handshake.
-            logger.info("OBS WebSocket requested re-identification")
-            try:
-                self._perform_handshake(self._config.request_timeout)
-            except Exception as exc:
-                logger.error("Re-identification failed: {}", exc)
-        elif op == 2:
-            self._identified.set()
-            logger.debug("OBS WebSocket identified again")
-        elif op == 5:
-            event_type = data.get("eventType")
-            logger.debug("OBS Event received: {}", event_type)
-        elif op == 7:
-            request_id = data.get("requestId")
-            if request_id:
-                with self._response_condition:
-                    self._responses[request_id] = data
-                    self._response_condition.notify_all()
-        elif op == 8:
-            request_id = data.get("requestId")
-            if request_id:
-                with self._response_condition:
-                    self._responses[request_id] = data
-                    self._response_condition.notify_all()
-        else:
-            logger.debug("Unhandled OBS message op={}: {}", op, data)
+    def _on_hello(self, data: Dict[str, Any]) -> None:
+        # OBS requested re-identification (hot reload). Answer this Hello.
+        logger.info("OBS WebSocket requested re-identification")
+        try:
+            self._perform_handshake(self._config.request_timeout, hello={"op": 0, "d": data})
+        except Exception as exc:
+            logger.error("Re-identification failed: {}", exc)
+
+    def _on_identified(self, data: Dict[str, Any]) -> None:
+        self._identified.set()
+        logger.debug("OBS WebSocket identified again")
+
+    def _on_event(self, data: Dict[str, Any]) -> None:
+        # Loguru drops disabled levels before formatting, so this only
+        # costs a level check per event.
+        logger.debug("OBS Event received: {}", data.get("eventType"))
+
+    def _on_response(self, data: Dict[str, Any]) -> None:
+        request_id = data.get("requestId")
+        if request_id:
+            self._deliver_response(request_id, data)
+
+    def _send_reidentify(self) -> None:
+        """Update session parameters in place (OBS answers with op=2 Identified)."""
+        logger.debug("Re-identifying with OBS WebSocket (eventSubscriptions={})", self._config.event_subscriptions)
+        self._send({"op": 3, "d": {"eventSubscriptions": self._config.event_subscriptions}})
 
     def _send(self, payload: Dict[str, Any]) -> None:
+        self._send_raw(encode_json(payload))
+
+    def _send_raw(self, message: bytes) -> None:
         if self._ws is None:
             raise OBSNotConnectedError("Cannot send payload, websocket is closed")
-        message = json.dumps(payload)
+        send_queue = self._send_queue
+        if send_queue is not None:
+            send_queue.put(message)
+            return
+        if self._writer_failed:
+            raise OBSConnectionError("Failed to send message to OBS: connection writer stopped")
+        # No writer yet (initial handshake): the caller owns the socket.
         try:
-            self._ws.send(message)
+            self._ws.send(message, ABNF.OPCODE_TEXT)
         except WebSocketException as exc:
             raise OBSConnectionError(f"Failed to send message to OBS: {exc}") from exc
 
-    def _recv(self, timeout: float) -> Dict[str, Any]:
+    def _recv(self) -> Dict[str, Any]:
+        """Receive one JSON payload using the socket's current timeout."""
         if self._ws is None:
             raise OBSNotConnectedError("Cannot receive payload, websocket is closed")
 
-        previous_timeout = self._ws.gettimeout()
-        self._ws.settimeout(timeout)
         try:
             message = self._ws.recv()
         except WebSocketException as exc:
             raise OBSConnectionError(f"Failed to receive data from OBS: {exc}") from exc
-        finally:
-            self._ws.settimeout(previous_timeout)
 
         try:
-            return json.loads(message)
+            return _loads(message)
         except json.JSONDecodeError as exc:
             raise OBSConnectionError("Received invalid JSON from OBS") from exc
 
-    def _wait_for_response(self, request_id: str, timeout: Optional[float]) -> Dict[str, Any]:
-        deadline = time.perf_counter() + (timeout or self._config.request_timeout)
-        with self._response_condition:
-            while True:
-                remaining = deadline - time.perf_counter()
-                if remaining <= 0:
-                    raise OBSResponseTimeoutError(
-                        f"Timeout waiting for OBS response to request {request_id}"
-                    )
-
-                if request_id in self._responses:
-                    data = self._responses.pop(request_id)
-                    return data
+    def _deliver_response(self, request_id: str, data: Dict[str, Any]) -> None:
+        slot = self._responses.pop(request_id, None)
+        if slot is None:
+            return
+        slot.data = data
+        slot.event.set()
 
-                self._response_condition.wait(timeout=remaining)
+    def _wait_for_response(
+        self, request_id: str, slot: _ResponseSlot, timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        # Fast path: the reply may already be in the slot (read without locking).
+        data = slot.data
+        if data is not None:
+            return data
+
+        if not slot.event.wait(timeout or self._config.request_timeout):
+            self._responses.pop(request_id, None)
+            raise OBSResponseTimeoutError(
+                f"Timeout waiting for OBS response to request {request_id}"
+            )
+        if slot.data is None:
+            raise OBSNotConnectedError(
+                f"Connection to OBS closed while waiting for request {request_id}"
+            )
+        return slot.data
+
+    def _fail_pending_responses(self) -> None:
+        """Wake every waiter of the closed connection; their replies can never arrive."""
+        while self._responses:
+            try:
+                _, slot = self._responses.popitem()
+            except KeyError:
+                break
+            slot.event.set()
 
     def _safe_close(self) -> None:
         if self._ws is not None:
@@ -414,8 +798,14 @@ class OBSConnectionManager:
         if challenge is None or salt is None:
             raise OBSAuthenticationError("OBS authentication payload missing challenge or salt")
 
-        secret = hashlib.sha256((self._config.password + salt).encode("utf-8")).digest()
-        secret_b64 = base64.b64encode(secret)
+        password = self._config.password
+        cached = self._auth_secret_cache
+        if cached is not None and cached[0] == password and cached[1] == salt:
+            secret_b64 = cached[2]
+        else:
+            secret = hashlib.sha256((password + salt).encode("utf-8")).digest()
+            secret_b64 = base64.b64encode(secret)
+            self._auth_secret_cache = (password, salt, secret_b64)
         auth_response = hashlib.sha256(secret_b64 + challenge.encode("utf-8")).digest()
         return base64.b64encode(auth_response).decode("utf-8")
 
@@ -428,4 +818,5 @@ __all__ = [
     "OBSResponseTimeoutError",
     "OBSRequestError",
     "OBSConnectionManager",
+    "encode_json",
 ]
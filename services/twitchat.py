@@ -8,48 +8,165 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Callable, Dict, Optional
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
 
-from .obs_connection import OBSConnectionManager
+from .obs_connection import OBSConnectionManager, encode_json
 
 logger = logging.getLogger("TwitchatPlugin")
 
 
+def _validate_action(action_type: str, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Validate an outgoing action once; everything downstream trusts the result."""
+    if not action_type:
+        raise ValueError("Action type must be provided")
+    if data is None:
+        return {}
+    if isinstance(data, dict):
+        return data
+    raise TypeError(f"Action data must be a dict, got {type(data).__name__}")
+
+
 class TwitchatAPI:
     """
     Sends Twitchat actions via OBS BroadcastCustomEvent and dispatches
     incoming Twitchat CustomEvents to registered listeners.
+
+    Actions are queued and sent by a background flusher, so a burst of key
+    presses is delivered to OBS as one RequestBatch instead of one RPC each.
     """
 
-    def __init__(self, connection: OBSConnectionManager) -> None:
+    def __init__(
+        self,
+        connection: OBSConnectionManager,
+        flush_interval_ms: int = 50,
+        batch_size: int = 50,
+    ) -> None:
         self._connection = connection
         self._listeners: Dict[str, list[Callable]] = {}
+        # Encoded BroadcastCustomEvent requestData for actions sent without data.
+        self._compiled: Dict[str, bytes] = {}
+
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.batch_size = max(1, batch_size)
+        # (action type, encoded BroadcastCustomEvent requestData)
+        self._pending: Deque[Tuple[str, bytes]] = deque()
+        self._pending_event = threading.Event()
+        self._batch_full = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop,
+            name="twitchat-action-flusher",
+            daemon=True,
+        )
+        self._flusher.start()
 
     # ------------------------------------------------------------------
     # Sending actions
     # ------------------------------------------------------------------
     def send_action(self, action_type: str, data: Optional[Dict[str, Any]] = None) -> bool:
-        """Send a Twitchat action via OBS BroadcastCustomEvent."""
-        if not action_type:
-            raise ValueError("Action type must be provided")
+        """
+        Queue a Twitchat action for delivery via OBS BroadcastCustomEvent.
 
-        event_data = {
-            "origin": "twitchat",
-            "type": action_type,
-            "data": data or {},
-        }
+        Returns False (and drops the action) when OBS is not connected, the
+        API is closed or the payload cannot be JSON encoded. True only means
+        the action was queued; delivery failures are logged by the flusher.
+        """
+        data = _validate_action(action_type, data)
+        if self._closed.is_set():
+            logger.warning("Dropping action %s: Twitchat API is closed", action_type)
+            return False
+        if not self._connection.is_connected():
+            logger.warning("Dropping action %s: OBS is not connected", action_type)
+            return False
 
+        # Encode now so one unserializable payload cannot fail a whole batch.
         try:
-            self._connection.send_request(
-                "BroadcastCustomEvent",
-                {"eventData": event_data},
-            )
-            logger.debug("Sent action: %s", action_type)
-            return True
-        except Exception as exc:
-            logger.error("Failed to send action %s: %s", action_type, exc)
+            encoded = self._encode_request_data(action_type, data)
+        except (TypeError, ValueError) as exc:
+            logger.error("Failed to encode action %s: %s", action_type, exc)
             return False
 
+        self._pending.append((action_type, encoded))
+        if len(self._pending) >= self.batch_size:
+            self._batch_full.set()
+        self._pending_event.set()
+        return True
+
+    def flush(self) -> None:
+        """Send every queued action now, blocking until OBS has answered."""
+        with self._flush_lock:
+            self._pending_event.clear()
+            self._batch_full.clear()
+            while self._pending:
+                batch = []
+                while self._pending and len(batch) < self.batch_size:
+                    batch.append(self._pending.popleft())
+                self._send_batch(batch)
+
+    def close(self) -> None:
+        """Stop the background flusher. Call flush() first to deliver queued actions."""
+        self._closed.set()
+        self._pending_event.set()
+        self._batch_full.set()
+        if self._flusher.is_alive() and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=1.0)
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._pending_event.wait()
+            if self._closed.is_set():
+                return
+            if len(self._pending) < self.batch_size:
+                # Give a burst of key presses a moment to coalesce.
+                self._batch_full.wait(self.flush_interval)
+                if self._closed.is_set():
+                    return
+            try:
+                self.flush()
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.error("Twitchat action flusher error: %s", exc)
+
+    def _send_batch(self, batch: list[Tuple[str, bytes]]) -> None:
+        requests = [("BroadcastCustomEvent", encoded) for _, encoded in batch]
+
+        try:
+            if len(requests) == 1:
+                self._connection.send_request(*requests[0])
+                results = [{"requestStatus": {"result": True}}]
+            else:
+                results = self._connection.send_request_batch(requests)
+        except Exception as exc:
+            for action_type, _ in batch:
+                logger.error("Failed to send action %s: %s", action_type, exc)
+            return
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for (action_type, _), result in zip(batch, results):
+            status = result.get("requestStatus", {})
+            if status.get("result", False):
+                if debug:
+                    logger.debug("Sent action: %s", action_type)
+            else:
+                logger.error(
+                    "Failed to send action %s: %s",
+                    action_type,
+                    status.get("comment") or status.get("code"),
+                )
+
+    def _encode_request_data(self, action_type: str, data: Dict[str, Any]) -> bytes:
+        if data:
+            return encode_json({"eventData": {"origin": "twitchat", "type": action_type, "data": data}})
+
+        # Fixed-shape actions (most buttons) encode once and reuse the bytes.
+        encoded = self._compiled.get(action_type)
+        if encoded is None:
+            encoded = encode_json({"eventData": {"origin": "twitchat", "type": action_type, "data": {}}})
+            self._compiled[action_type] = encoded
+        return encoded
+
     # ------------------------------------------------------------------
     # Receiving events
     # ------------------------------------------------------------------
@@ -72,6 +189,13 @@ class TwitchatAPI:
         Process a raw OBS WebSocket message, dispatching Twitchat events.
         Called by OBSConnectionManager's receiver loop.
         """
+        # Cheap substring scan so responses and unrelated OBS events skip
+        # a second JSON decode; only CustomEvents can carry Twitchat data.
+        # The quotes matter: every reply to our own requests contains
+        # "BroadcastCustomEvent", which the quoted token cannot match.
+        if '"CustomEvent"' not in message:
+            return
+
         try:
             payload = json.loads(message)
         except json.JSONDecodeError:
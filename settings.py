@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import functools
+from dataclasses import asdict, dataclass, replace
 from typing import Any, Dict
 
 from .services import OBSConnectionConfig
 
 
-@dataclass
+@dataclass(frozen=True)
 class TwitchatSettings:
     """Serializable settings for the Twitchat integration plugin."""
 
@@ -32,8 +33,8 @@ class TwitchatSettings:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        return data
+        # Copy so callers can mutate the result without poisoning the cache.
+        return dict(_settings_dict(self))
 
     def to_obs_config(self) -> OBSConnectionConfig:
         return OBSConnectionConfig(
@@ -45,9 +46,37 @@ class TwitchatSettings:
         )
 
     def update(self, **kwargs: Any) -> "TwitchatSettings":
+        if all(_is_normalized(key, value) for key, value in kwargs.items()):
+            return replace(self, **kwargs)
         data = self.to_dict()
         data.update(kwargs)
         return self.from_dict(data)
 
 
+_FIELD_TYPES: Dict[str, type] = {
+    "host": str,
+    "port": int,
+    "password": str,
+    "chat_column": int,
+    "use_ssl": bool,
+    "namespace": str,
+    "request_timeout": float,
+}
+_STRIPPED_FIELDS = frozenset({"host", "namespace"})
+
+
+@functools.lru_cache(maxsize=8)
+def _settings_dict(settings: TwitchatSettings) -> Dict[str, Any]:
+    return asdict(settings)
+
+
+def _is_normalized(key: str, value: Any) -> bool:
+    """Whether ``value`` is already what ``from_dict`` would produce for ``key``."""
+    if type(value) is not _FIELD_TYPES.get(key):
+        return False
+    if key in _STRIPPED_FIELDS:
+        return bool(value) and value == value.strip()
+    return True
+
+
 __all__ = ["TwitchatSettings"]